@@ -1,176 +1,471 @@
 #!/usr/bin/env python3
 import requests
+import requests.adapters
 import json
 import datetime
+import functools
 import os
+import sqlite3
 import sys
+import threading
+import time
 import logging
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
+from urllib3.util.retry import Retry
 import pytz  # Import pytz for timezone handling
 
-# Load environment variables from .env file
-env_path = Path('.') / '.env'
-load_dotenv(dotenv_path=env_path)
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# orjson parses large JSON arrays several times faster than stdlib json;
+# fall back to the stdlib when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+def _decode_json_body(body: bytes, response: requests.Response) -> Any:
+    """Decode a JSON body, mapping failures onto requests' exception
+    hierarchy.
+
+    response.json() raises a RequestException subclass on malformed
+    bodies, which the API methods catch to degrade a single instance to
+    []; decoding through _json_loads must fail the same way so e.g. a
+    reverse proxy's HTML error page can't abort the whole run.
+    """
+    try:
+        return _json_loads(body)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(e, request=response.request)
+
+
 logger = logging.getLogger("release_notifier")
 
 
+def setup_logging():
+    """Install the stream handler; deferred to main() so importing the
+    module has no logging side effects"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+
 # Configuration
 class Config:
-    # Discord webhook URL
-    DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
-
-    # Radarr configurations
-    RADARR_INSTANCES = [
-        {
-            "name": "Movies 4K",
-            "url": os.environ.get("RADARR_4K_URL", ""),
-            "api_key": os.environ.get("RADARR_4K_API_KEY", ""),
-        },
-        {
-            "name": "Movies",
-            "url": os.environ.get("RADARR_URL", ""),
-            "api_key": os.environ.get("RADARR_API_KEY", ""),
-        }
-    ]
-
-    # Sonarr configurations
-    SONARR_INSTANCES = [
-        {
-            "name": "Anime",
-            "url": os.environ.get("SONARR_ANIME_URL", ""),
-            "api_key": os.environ.get("SONARR_ANIME_API_KEY", ""),
-        },
-        {
-            "name": "TV Shows",
-            "url": os.environ.get("SONARR_URL", ""),
-            "api_key": os.environ.get("SONARR_API_KEY", ""),
-        }
-    ]
+    # Env-derived attributes are populated by load() below; calling it at
+    # import time keeps `Config.X` access working for standalone use,
+    # while main() calls it again after load_dotenv so .env values win.
+    DISCORD_WEBHOOK_URL = ""
+    RADARR_INSTANCES: List[Dict[str, str]] = []
+    SONARR_INSTANCES: List[Dict[str, str]] = []
 
     # Define EST timezone
     TIMEZONE = pytz.timezone('US/Eastern')
 
-
-class RadarrAPI:
-    def __init__(self, base_url: str, api_key: str, instance_name: str):
+    # HTTP timeouts: (connect, read) in seconds
+    REQUEST_TIMEOUT = (3.05, 15)
+
+    # Discord rejects message content over 2000 characters; keep a margin
+    DISCORD_MESSAGE_LIMIT = 1900
+
+    # Cache TTLs (seconds) for idempotent API GETs. Library listings only
+    # change when content is added, so they can live longer than the
+    # calendar.
+    LIBRARY_CACHE_TTL = 300
+    CALENDAR_CACHE_TTL = 60
+
+    @classmethod
+    def load(cls):
+        """(Re)read all environment-derived configuration"""
+        cls.DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
+
+        # Radarr configurations
+        cls.RADARR_INSTANCES = [
+            {
+                "name": "Movies 4K",
+                "url": os.environ.get("RADARR_4K_URL", ""),
+                "api_key": os.environ.get("RADARR_4K_API_KEY", ""),
+            },
+            {
+                "name": "Movies",
+                "url": os.environ.get("RADARR_URL", ""),
+                "api_key": os.environ.get("RADARR_API_KEY", ""),
+            }
+        ]
+
+        # Sonarr configurations
+        cls.SONARR_INSTANCES = [
+            {
+                "name": "Anime",
+                "url": os.environ.get("SONARR_ANIME_URL", ""),
+                "api_key": os.environ.get("SONARR_ANIME_API_KEY", ""),
+            },
+            {
+                "name": "TV Shows",
+                "url": os.environ.get("SONARR_URL", ""),
+                "api_key": os.environ.get("SONARR_API_KEY", ""),
+            }
+        ]
+
+        cls.LIBRARY_CACHE_TTL = int(os.environ.get("LIBRARY_CACHE_TTL", "300"))
+        cls.CALENDAR_CACHE_TTL = int(os.environ.get("CALENDAR_CACHE_TTL", "60"))
+
+        # Whether to post the "nothing today" message on quiet days
+        cls.NOTIFY_ON_EMPTY = os.environ.get("NOTIFY_ON_EMPTY", "true").lower() == "true"
+
+
+# Populate once at import so standalone Config access works; main()
+# reloads after .env is read
+Config.load()
+
+
+class DiskCache:
+    """SQLite-backed response cache shared across invocations.
+
+    A cron-driven script loses its in-memory cache between runs, so the
+    expensive library listings would otherwise be re-downloaded every time.
+    Cached bodies are revalidated with conditional GETs (If-None-Match /
+    If-Modified-Since); a 304 means the stored body can be reused without
+    transferring it again.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+            path = cache_home / "media_release_informer" / "cache.sqlite"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT NOT NULL,"
+            " params TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " body TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (url, params))"
+        )
+        self._conn.commit()
+
+    def get(self, url: str, params_key: str) -> Optional[tuple]:
+        """Return (etag, last_modified, body) for a cached response, if any"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ? AND params = ?",
+                (url, params_key)
+            ).fetchone()
+        return row
+
+    def put(self, url: str, params_key: str, etag: Optional[str],
+            last_modified: Optional[str], body: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, params, etag, last_modified, body, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (url, params_key, etag, last_modified, body, time.time())
+            )
+            self._conn.commit()
+
+
+# Process-wide cache of parsed API responses keyed by
+# (instance name, url, params), storing (fetched_at, json) pairs. Lets
+# repeated calls within the TTL window skip the network entirely.
+_API_CACHE: Dict[tuple, tuple] = {}
+
+# Lazily created disk cache; None until first use, False if unavailable
+_DISK_CACHE: Any = None
+
+
+def _get_disk_cache() -> Optional[DiskCache]:
+    global _DISK_CACHE
+    if _DISK_CACHE is None:
+        try:
+            _DISK_CACHE = DiskCache()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Disk cache unavailable: {e}")
+            _DISK_CACHE = False
+    return _DISK_CACHE or None
+
+
+def cached_get_json(session: requests.Session, instance_name: str, url: str,
+                    params: Optional[Dict[str, str]] = None,
+                    ttl: Optional[int] = None) -> Any:
+    """GET a JSON endpoint, serving repeats from the TTL cache"""
+    if ttl is None:
+        ttl = Config.LIBRARY_CACHE_TTL
+    key = (instance_name, url, tuple(sorted(params.items())) if params else ())
+    now = time.monotonic()
+    hit = _API_CACHE.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+
+    # Revalidate against the disk cache so an unchanged body costs a 304
+    # instead of a full transfer, even on a fresh process.
+    disk = _get_disk_cache()
+    params_key = json.dumps(params or {}, sort_keys=True)
+    cached = None
+    if disk:
+        try:
+            cached = disk.get(url, params_key)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read from disk cache: {e}")
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    response = session.get(url, params=params, headers=headers or None,
+                           timeout=Config.REQUEST_TIMEOUT)
+    if response.status_code == 304 and cached:
+        data = _decode_json_body(cached[2], response)
+    else:
+        response.raise_for_status()
+        data = _decode_json_body(response.content, response)
+        if disk:
+            try:
+                disk.put(url, params_key, response.headers.get('ETag'),
+                         response.headers.get('Last-Modified'), response.text)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write to disk cache: {e}")
+
+    _API_CACHE[key] = (now, data)
+    return data
+
+
+def build_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Create a requests Session with connection pooling and retries.
+
+    Reusing a session keeps connections alive between calls, which avoids
+    paying the TCP/TLS handshake cost for every request to the same host.
+    """
+    session = requests.Session()
+    # requests negotiates gzip by default, but be explicit so a stripped
+    # default can't silently cost us compressed transfer of the multi-MB
+    # library listings
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    if headers:
+        session.headers.update(headers)
+    # Retry transient failures with backoff rather than silently losing a
+    # whole instance's releases to one 503. Only GETs are retried: they
+    # are idempotent, while re-POSTing a webhook could double-notify.
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclass(frozen=True)
+class RunContext:
+    """One snapshot of "now" shared by the whole pipeline.
+
+    Taking the timestamp once in main() means every component agrees on
+    the current date, so a run that straddles midnight can't mix two
+    different "today" values - and the repeated now()/strftime calls go
+    away.
+    """
+    now: datetime.datetime
+    today: str
+    tomorrow: str
+
+    @classmethod
+    def create(cls) -> "RunContext":
+        now = datetime.datetime.now(Config.TIMEZONE)
+        return cls(
+            now=now,
+            today=now.strftime('%Y-%m-%d'),
+            tomorrow=(now + datetime.timedelta(days=1)).strftime('%Y-%m-%d'),
+        )
+
+
+def _parse_utc(date_str: str) -> datetime.datetime:
+    """Parse an ISO 8601 timestamp, tolerating the trailing Z.
+
+    fromisoformat is the C fast path; the slice only rewrites the suffix
+    when a Z is actually present, unlike a whole-string replace.
+    """
+    if date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
+    return datetime.datetime.fromisoformat(date_str)
+
+
+# Shape check for plain YYYY-MM-DD strings
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_date(date_str: Optional[str]) -> Optional[str]:
+    """Extract just the date part (YYYY-MM-DD) from a date string,
+    converting timestamps to EST first.
+
+    Cached per unique input: the same release dates recur across the
+    movies and episodes of a single run, so each distinct string is
+    parsed once.
+    """
+    if not date_str:
+        return None
+    if 'T' not in date_str:
+        # Already just a date: a precompiled pattern check is far cheaper
+        # than raising and catching ValueError on bad input
+        return date_str if _DATE_RE.match(date_str) else None
+    try:
+        return _parse_utc(date_str).astimezone(Config.TIMEZONE).strftime('%Y-%m-%d')
+    except (ValueError, AttributeError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_time(date_str: Optional[str]) -> Optional[str]:
+    """Extract the time part from a date string, formatted nicely in EST
+    (e.g. "3:30 PM EST"). Cached like _extract_date."""
+    if not date_str or 'T' not in date_str:
+        return None
+    try:
+        return _parse_utc(date_str).astimezone(Config.TIMEZONE).strftime('%I:%M %p EST')
+    except (ValueError, AttributeError):
+        return None
+
+
+def _make_today_matcher(today: str):
+    """Build a cheap is-it-today predicate with the date baked in.
+
+    API dates are ISO 8601 with the date first, so a prefix comparison is
+    equivalent to parsing the date out - without the cost of strptime per
+    item. Capturing today in a closure keeps the comparison on fast local
+    lookups inside tight loops.
+    """
+    def match(date_str: Optional[str]) -> bool:
+        return bool(date_str) and date_str[:10] == today
+    return match
+
+
+class ArrAPI:
+    """Shared plumbing for the Radarr/Sonarr clients: pooled session,
+    API-key headers, run context, and cached GETs"""
+
+    def __init__(self, base_url: str, api_key: str, instance_name: str,
+                 ctx: Optional[RunContext] = None):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.instance_name = instance_name
+        self.ctx = ctx or RunContext.create()
         self.headers = {
             "X-Api-Key": self.api_key,
             "Content-Type": "application/json"
         }
+        self.session = build_session(self.headers)
+
+    def _get(self, path: str, params: Optional[Dict[str, str]] = None,
+             ttl: Optional[int] = None) -> Any:
+        """GET an API path through the response caches"""
+        return cached_get_json(self.session, self.instance_name,
+                               f"{self.base_url}{path}", params=params, ttl=ttl)
 
+
+class RadarrAPI(ArrAPI):
     def get_movies(self) -> List[Dict[str, Any]]:
         """Get all monitored movies from Radarr"""
         try:
-            response = requests.get(f"{self.base_url}/api/v3/movie", headers=self.headers)
-            response.raise_for_status()
-            all_movies = response.json()
+            all_movies = self._get("/api/v3/movie")
             return [movie for movie in all_movies if movie.get('monitored', False)]
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching movies from {self.instance_name}: {e}")
             return []
 
-    def get_todays_releases(self) -> List[Dict[str, Any]]:
-        """Get all movies being released today"""
-        # Get today's date in YYYY-MM-DD format
-        today = datetime.datetime.now(Config.TIMEZONE).strftime('%Y-%m-%d')
+    def get_calendar(self, start_date: str, end_date: str) -> Optional[List[Dict[str, Any]]]:
+        """Get movies with a release date between start_date and end_date.
 
-        movies = self.get_movies()
-        todays_releases = []
-
-        for movie in movies:
-            is_today = False
-
-            # Try exact date matches first
-            digital_release = self._extract_date(movie.get('digitalRelease'))
-            physical_release = self._extract_date(movie.get('physicalRelease'))
-            cinema_release = self._extract_date(movie.get('inCinemas'))
-
-            if digital_release == today or physical_release == today or cinema_release == today:
-                is_today = True
-
-            # Fallback approach for dates that might not parse properly
-            if not is_today:
-                # Check if any release type contains today's date string
-                digital = movie.get('digitalRelease', '')
-                physical = movie.get('physicalRelease', '')
-                cinema = movie.get('inCinemas', '')
-
-                if (digital and today in digital) or (physical and today in physical) or (cinema and today in cinema):
-                    is_today = True
-
-            if is_today:
-                todays_releases.append(movie)
-
-        logger.info(f"Found {len(todays_releases)} movies releasing today after filtering")
-        return todays_releases
-
-    def _extract_date(self, date_str: Optional[str]) -> Optional[str]:
-        """Extract just the date part (YYYY-MM-DD) from a date string"""
-        if not date_str:
-            return None
-
-        # Handle ISO format dates that might include time
+        Returns None (rather than []) on failure so callers can fall back
+        to scanning the full library.
+        """
         try:
-            # Try to parse as datetime and extract just the date part
-            date_part = date_str.split('T')[0] if 'T' in date_str else date_str
-            # Validate that it's a proper date
-            datetime.datetime.strptime(date_part, '%Y-%m-%d')
-            return date_part
-        except (ValueError, AttributeError):
-            logger.warning(f"Could not parse date: {date_str}")
-            return None
-
-    def _extract_time(self, date_str: Optional[str]) -> Optional[str]:
-        """Extract just the time part from a date string and format it nicely in EST"""
-        if not date_str or 'T' not in date_str:
+            params = {
+                "start": start_date,
+                "end": end_date,
+                "unmonitored": "false"  # Only monitored movies
+            }
+            return self._get("/api/v3/calendar", params=params, ttl=Config.CALENDAR_CACHE_TTL)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching calendar from {self.instance_name}: {e}")
             return None
 
-        try:
-            # Parse the ISO format datetime
-            if 'Z' in date_str:
-                date_obj = datetime.datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            else:
-                date_obj = datetime.datetime.fromisoformat(date_str)
+    def get_todays_releases(self) -> List[Dict[str, Any]]:
+        """Get all movies being released today"""
+        # Today's date in YYYY-MM-DD format, shared across the run
+        today = self.ctx.today
+
+        # Each release field is read once and checked with a
+        # prefix-comparison predicate that has today's date baked in
+        is_today = _make_today_matcher(today)
+
+        def releases_today(movie: Dict[str, Any]) -> bool:
+            return (is_today(movie.get('digitalRelease'))
+                    or is_today(movie.get('physicalRelease'))
+                    or is_today(movie.get('inCinemas')))
+
+        # Let Radarr filter by release window server-side; that moves a
+        # handful of records instead of the whole library. Fall back to the
+        # full library scan if the calendar endpoint is unavailable. Either
+        # way the result is produced in one fused pass with no intermediate
+        # monitored-only list.
+        calendar_items = self.get_calendar(today, self.ctx.tomorrow)
+        if calendar_items is not None:
+            todays_releases = [
+                movie for movie in calendar_items
+                if movie.get('monitored', False) and releases_today(movie)
+            ]
+        else:
+            # get_movies already filters to monitored entries
+            todays_releases = [movie for movie in self.get_movies() if releases_today(movie)]
 
-            # Convert to EST
-            est_date_obj = date_obj.astimezone(Config.TIMEZONE)
+        logger.info(f"Found {len(todays_releases)} movies releasing today after filtering")
+        return todays_releases
 
-            # Format as a nice time (e.g., "3:30 PM EST")
-            return est_date_obj.strftime('%I:%M %p EST')
-        except (ValueError, AttributeError):
-            return None
 
-
-class SonarrAPI:
-    def __init__(self, base_url: str, api_key: str, instance_name: str):
-        self.base_url = base_url.rstrip('/')
-        self.api_key = api_key
-        self.instance_name = instance_name
-        self.headers = {
-            "X-Api-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
+class SonarrAPI(ArrAPI):
+    def __init__(self, base_url: str, api_key: str, instance_name: str,
+                 ctx: Optional[RunContext] = None):
+        super().__init__(base_url, api_key, instance_name, ctx)
+        # Cached {series id: series dict} map for calendar enrichment
+        self._series_by_id: Optional[Dict[int, Dict[str, Any]]] = None
+        self._series_by_id_fetched_at = 0.0
 
     def get_series(self) -> List[Dict[str, Any]]:
         """Get all monitored series from Sonarr"""
         try:
-            response = requests.get(f"{self.base_url}/api/v3/series", headers=self.headers)
-            response.raise_for_status()
-            all_series = response.json()
+            all_series = self._get("/api/v3/series")
             return [series for series in all_series if series.get('monitored', False)]
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching series from {self.instance_name}: {e}")
@@ -182,41 +477,71 @@ class SonarrAPI:
             params = {
                 "start": start_date,
                 "end": end_date,
-                "includeEpisodeFile": "true",  # Include file info if available
+                "includeSeries": "true",  # Embed series info, avoiding the N+1 lookup
+                "includeEpisodeFile": "false",  # File info is never read
                 "includeEpisodeImages": "false",  # No need for images
                 "includeSeriesImages": "false"  # No need for images
             }
-            response = requests.get(f"{self.base_url}/api/v3/calendar", headers=self.headers, params=params)
-            response.raise_for_status()
-            calendar_items = response.json()
-
-            # Enrich calendar items with series information
-            for item in calendar_items:
-                if 'seriesId' in item and not ('series' in item and 'title' in item.get('series', {})):
-                    try:
-                        series_response = requests.get(
-                            f"{self.base_url}/api/v3/series/{item['seriesId']}",
-                            headers=self.headers
-                        )
-                        if series_response.status_code == 200:
-                            item['series'] = series_response.json()
-                    except requests.exceptions.RequestException:
-                        pass  # If we can't get series info, just continue
+            calendar_items = self._get("/api/v3/calendar", params=params,
+                                       ttl=Config.CALENDAR_CACHE_TTL)
+
+            # includeSeries above embeds the series info server-side; the
+            # bulk fetch below is only a fallback for older Sonarr installs
+            # that ignore the parameter, and costs one round-trip rather
+            # than the old one-per-episode.
+            needs_series = [
+                item for item in calendar_items
+                if 'seriesId' in item and not ('series' in item and 'title' in item.get('series', {}))
+            ]
+            if needs_series:
+                series_by_id = self._get_series_by_id()
+                for item in needs_series:
+                    series = series_by_id.get(item['seriesId'])
+                    if series is not None:
+                        item['series'] = series
 
             return calendar_items
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching calendar from {self.instance_name}: {e}")
             return []
 
+    def _get_series_by_id(self) -> Dict[int, Dict[str, Any]]:
+        """Fetch all series once and index them by id, with a short TTL cache"""
+        now = time.monotonic()
+        if self._series_by_id is not None and now - self._series_by_id_fetched_at < 60:
+            return self._series_by_id
+
+        try:
+            series_list = self._get("/api/v3/series")
+            self._series_by_id = {series['id']: series for series in series_list}
+            self._series_by_id_fetched_at = now
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching series list from {self.instance_name}: {e}")
+            return self._series_by_id or {}
+
+        return self._series_by_id
+
     def get_todays_episodes(self) -> List[Dict[str, Any]]:
         """Get all episodes airing today"""
-        today = datetime.datetime.now(Config.TIMEZONE).strftime('%Y-%m-%d')
-        tomorrow = (datetime.datetime.now(Config.TIMEZONE) + datetime.timedelta(days=1)).strftime('%Y-%m-%d')
+        today = self.ctx.today
+        tomorrow = self.ctx.tomorrow
 
         # Get all episodes in the date range
         all_episodes = self.get_calendar(today, tomorrow)
 
-        # Check each episode more carefully and log what we're analyzing
+        # Express today's EST day as a UTC window once, so the per-episode
+        # check becomes a tz-aware comparison instead of an astimezone +
+        # strftime round-trip per item
+        today_date = datetime.date.fromisoformat(today)
+        day_start = Config.TIMEZONE.localize(datetime.datetime.combine(today_date, datetime.time.min))
+        day_end = Config.TIMEZONE.localize(
+            datetime.datetime.combine(today_date + datetime.timedelta(days=1), datetime.time.min))
+
+        # Check each episode more carefully and log what we're analyzing.
+        # Hot names are bound as locals so the loop skips the global and
+        # attribute lookups per iteration.
+        parse_utc = _parse_utc
+        utc = pytz.utc
         todays_episodes = []
         for episode in all_episodes:
             air_date_utc = episode.get('airDateUtc')
@@ -227,86 +552,75 @@ class SonarrAPI:
             # First try exact date matches
             if air_date and air_date.startswith(today):
                 is_today = True
-                logger.debug(f"Episode matched by airDate: {air_date}")
+                logger.debug("Episode matched by airDate: %s", air_date)
 
             # Then try UTC date conversion
             elif air_date_utc:
                 try:
-                    # Convert UTC date to EST date
-                    if 'Z' in air_date_utc:
-                        date_obj = datetime.datetime.fromisoformat(air_date_utc.replace('Z', '+00:00'))
-                    else:
-                        date_obj = datetime.datetime.fromisoformat(air_date_utc)
-
-                    # Convert to EST
-                    est_date_obj = date_obj.astimezone(Config.TIMEZONE)
-
-                    # Get EST date
-                    local_date = est_date_obj.strftime('%Y-%m-%d')
-                    if local_date == today:
+                    # Membership in the precomputed window; comparing
+                    # tz-aware datetimes needs no explicit conversion
+                    aired = parse_utc(air_date_utc)
+                    if aired.tzinfo is None:
+                        aired = utc.localize(aired)
+                    if day_start <= aired < day_end:
                         is_today = True
-                        logger.debug(f"Episode matched by airDateUtc conversion: {air_date_utc} -> {local_date}")
+                        logger.debug("Episode matched by airDateUtc window: %s", air_date_utc)
                 except (ValueError, AttributeError):
                     # If we can't parse, fall back to checking starts with
                     if air_date_utc.startswith(today):
                         is_today = True
-                        logger.debug(f"Episode matched by airDateUtc startswith: {air_date_utc}")
+                        logger.debug("Episode matched by airDateUtc startswith: %s", air_date_utc)
 
-            # As a fallback, use the original approach
-            # This is necessary because sometimes the date format in Sonarr's API can be inconsistent
-            if not is_today and ((air_date and today in air_date) or (air_date_utc and today in air_date_utc)):
+            # As a fallback, check the date prefix directly. Sonarr dates
+            # are ISO 8601 with the date first, so startswith is equivalent
+            # to the old substring scan but is a bounded C-level compare.
+            if not is_today and ((air_date and air_date.startswith(today))
+                                 or (air_date_utc and air_date_utc.startswith(today))):
                 is_today = True
-                logger.debug(f"Episode matched by fallback contains: airDate={air_date}, airDateUtc={air_date_utc}")
+                logger.debug("Episode matched by fallback prefix: airDate=%s, airDateUtc=%s", air_date, air_date_utc)
 
             if is_today:
+                # Resolve the series title once at ingestion so the
+                # notifier's grouping doesn't re-walk the dict per episode
+                series = episode.get('series')
+                if isinstance(series, dict) and 'title' in series:
+                    episode['_series_title'] = series['title']
+                elif 'seriesTitle' in episode:
+                    episode['_series_title'] = episode['seriesTitle']
                 todays_episodes.append(episode)
 
         logger.info(f"Found {len(todays_episodes)} episodes airing today after filtering")
         return todays_episodes
 
-    def _extract_date(self, date_str: Optional[str]) -> Optional[str]:
-        """Extract just the date part (YYYY-MM-DD) from a date string"""
-        if not date_str:
-            return None
 
-        # Handle ISO format dates that might include time
-        try:
-            # Try to parse as datetime and extract just the date part
-            if 'T' in date_str:
-                # Handle ISO format with timezone
-                if 'Z' in date_str:
-                    date_obj = datetime.datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                else:
-                    date_obj = datetime.datetime.fromisoformat(date_str)
-
-                # Convert to EST timezone
-                est_date_obj = date_obj.astimezone(Config.TIMEZONE)
-                return est_date_obj.strftime('%Y-%m-%d')
-            else:
-                # It's already just a date
-                datetime.datetime.strptime(date_str, '%Y-%m-%d')  # Validate format
-                return date_str
-        except (ValueError, AttributeError):
-            logger.warning(f"Could not parse date: {date_str}")
-            return None
+# Release-date fields on a Radarr movie and the labels they get in the
+# notification, in display order
+RELEASE_FIELDS = (
+    ('digitalRelease', 'Digital'),
+    ('physicalRelease', 'Physical'),
+    ('inCinemas', 'Cinema'),
+)
 
 
 class DiscordNotifier:
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, ctx: Optional[RunContext] = None):
         self.webhook_url = webhook_url
+        self.ctx = ctx or RunContext.create()
+        self.session = build_session()
 
     def send_notification(self, movie_releases: Dict[str, List[Dict[str, Any]]],
                           tv_releases: Dict[str, List[Dict[str, Any]]]) -> bool:
         """Send a notification to Discord with today's releases"""
-        today = datetime.datetime.now(Config.TIMEZONE).strftime('%Y-%m-%d')
+        today = self.ctx.today
 
-        # Build the message content
-        message = f"# Media Releases for {today}\n\n"
+        # Build the message content as a list of fragments; a single join at
+        # the end avoids quadratic string concatenation on busy days
+        parts = [f"# Media Releases for {today}\n\n"]
 
         # Add movie releases to the message (no "Movies" header)
         for instance, movies in movie_releases.items():
             if movies:
-                message += f"## {instance}\n"
+                parts.append(f"## {instance}\n")
                 for movie in movies:
                     title = movie.get('title', 'Unknown Title')
                     year = movie.get('year', 'Unknown Year')
@@ -314,172 +628,125 @@ class DiscordNotifier:
                     # Determine the release type and time
                     release_types = []
                     release_time = ""
-                    today_str = datetime.datetime.now(Config.TIMEZONE).strftime('%Y-%m-%d')
-
-                    # Check digital release
-                    digital_date = self._extract_date(movie.get('digitalRelease'))
-                    if digital_date == today_str:
-                        release_types.append("Digital")
-                        # Try to extract time if available
-                        if movie.get('digitalRelease') and 'T' in movie.get('digitalRelease', ''):
-                            try:
-                                digital_time = self._extract_time(movie.get('digitalRelease'))
-                                if digital_time and not release_time:
-                                    release_time = f" at {digital_time}"
-                            except:
-                                pass
-
-                    # Check physical release
-                    physical_date = self._extract_date(movie.get('physicalRelease'))
-                    if physical_date == today_str:
-                        release_types.append("Physical")
-                        # Try to extract time if available
-                        if movie.get('physicalRelease') and 'T' in movie.get('physicalRelease', ''):
-                            try:
-                                physical_time = self._extract_time(movie.get('physicalRelease'))
-                                if physical_time and not release_time:
-                                    release_time = f" at {physical_time}"
-                            except:
-                                pass
 
-                    # Check cinema release
-                    cinema_date = self._extract_date(movie.get('inCinemas'))
-                    if cinema_date == today_str:
-                        release_types.append("Cinema")
+                    # Walk the (field, label) table instead of three copies
+                    # of the same check; each field is read exactly once
+                    for field, label in RELEASE_FIELDS:
+                        value = movie.get(field)
+                        if _extract_date(value) != today:
+                            continue
+                        release_types.append(label)
                         # Try to extract time if available
-                        if movie.get('inCinemas') and 'T' in movie.get('inCinemas', ''):
-                            try:
-                                cinema_time = self._extract_time(movie.get('inCinemas'))
-                                if cinema_time and not release_time:
-                                    release_time = f" at {cinema_time}"
-                            except:
-                                pass
+                        if not release_time and value and 'T' in value:
+                            field_time = _extract_time(value)
+                            if field_time:
+                                release_time = f" at {field_time}"
 
                     release_type = f"{', '.join(release_types)} Release" if release_types else "Released Today"
 
-                    message += f"- **{title}** ({year}) - {release_type}{release_time}\n"
+                    parts.append(f"- **{title}** ({year}) - {release_type}{release_time}\n")
 
-        # Add TV episodes to the message (no "TV Episodes" header)
+        # Add TV episodes to the message (no "TV Episodes" header).
+        # Bind the timezone once rather than resolving Config.TIMEZONE for
+        # every formatted episode.
+        tz = Config.TIMEZONE
         for instance, episodes in tv_releases.items():
             if episodes:
-                message += f"## {instance}\n"
+                parts.append(f"## {instance}\n")
 
                 # Group episodes by series
-                series_episodes = {}
+                series_episodes: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
                 for episode in episodes:
-                    # Use a consistent approach - first try to get series info from the parent object
-                    if 'series' in episode and isinstance(episode['series'], dict):
-                        series_title = episode['series'].get('title', 'Unknown Series')
-                    # Then try other fields
-                    elif 'seriesTitle' in episode:
-                        series_title = episode.get('seriesTitle', 'Unknown Series')
-                    else:
-                        series_title = 'Unknown Series'
-                        logger.warning(f"Could not find series title for episode: {episode}")
-
-                    if series_title not in series_episodes:
-                        series_episodes[series_title] = []
-                    series_episodes[series_title].append(episode)
+                    # Prefer the title resolved at ingestion; fall back to
+                    # walking the dict for episodes from other sources
+                    title = episode.get('_series_title') or self._series_title(episode)
+                    series_episodes[title].append(episode)
 
                 # Add episodes for each series
                 for series_title, series_eps in series_episodes.items():
                     # Show series title without TVDB link
-                    message += f"- **{series_title}**\n"
+                    parts.append(f"- **{series_title}**\n")
 
                     for episode in series_eps:
-                        # Get season and episode numbers
+                        # Bind each field once; no repeated dict lookups in
+                        # the formatting below
                         season_num = episode.get('seasonNumber', 0)
                         episode_num = episode.get('episodeNumber', 0)
-
-                        # Get episode title - most commonly in 'title' field
                         episode_title = episode.get('title', 'Unknown Episode')
+                        air_date_utc = episode.get('airDateUtc')
 
                         # Show episode title and air time if available
                         air_time = ""
-                        if episode.get('airDateUtc'):
+                        if air_date_utc:
                             try:
-                                # Parse UTC time and convert to EST time with formatted output
-                                if 'Z' in episode['airDateUtc']:
-                                    date_obj = datetime.datetime.fromisoformat(
-                                        episode['airDateUtc'].replace('Z', '+00:00'))
-                                else:
-                                    date_obj = datetime.datetime.fromisoformat(episode['airDateUtc'])
-
-                                # Convert to EST
-                                est_date_obj = date_obj.astimezone(Config.TIMEZONE)
-
-                                # Format as a nice time (e.g., "3:30 PM EST")
+                                # Parse UTC time, convert to EST, and format
+                                # as a nice time (e.g., "3:30 PM EST")
+                                est_date_obj = _parse_utc(air_date_utc).astimezone(tz)
                                 air_time = f" - {est_date_obj.strftime('%I:%M %p EST')}"
                             except (ValueError, AttributeError):
                                 pass
 
-                        message += f"  - S{season_num:02d}E{episode_num:02d} - {episode_title}{air_time}\n"
+                        parts.append(f"  - S{season_num:02d}E{episode_num:02d} - {episode_title}{air_time}\n")
 
         # Check if there are no releases today
         if not any(movies for movies in movie_releases.values()) and not any(episodes for episodes in tv_releases.values()):
-            message += "No monitored content is being released today.\n"
-
-        # Send the message to Discord
-        payload = {
-            "content": message
-        }
-
+            parts.append("No monitored content is being released today.\n")
+
+        # Send the message to Discord, batching fragments into as few posts
+        # as fit under the content limit. Splitting on fragment boundaries
+        # keeps lines intact, and the pooled session reuses one connection
+        # across the sequential posts.
+        success = True
+        batch: List[str] = []
+        batch_len = 0
+        for part in parts:
+            if batch and batch_len + len(part) > Config.DISCORD_MESSAGE_LIMIT:
+                success = self._post_content("".join(batch)) and success
+                batch = []
+                batch_len = 0
+            batch.append(part)
+            batch_len += len(part)
+        if batch:
+            success = self._post_content("".join(batch)) and success
+
+        if success:
+            logger.info(f"Notification sent successfully!")
+        return success
+
+    @staticmethod
+    def _series_title(episode: Dict[str, Any]) -> str:
+        """Resolve an episode's series title from whichever field carries it"""
+        # First try the series info from the parent object, then other fields
+        series = episode.get('series')
+        if isinstance(series, dict):
+            return series.get('title', 'Unknown Series')
+        if 'seriesTitle' in episode:
+            return episode.get('seriesTitle', 'Unknown Series')
+        logger.warning("Could not find series title for episode: %s", episode)
+        return 'Unknown Series'
+
+    def _post_content(self, content: str) -> bool:
+        """POST one message payload to the webhook"""
         try:
-            response = requests.post(self.webhook_url, json=payload)
+            response = self.session.post(
+                self.webhook_url,
+                data=_json_dumps({"content": content}),
+                headers={"Content-Type": "application/json"},
+                timeout=Config.REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            logger.info(f"Notification sent successfully!")
             return True
         except requests.exceptions.RequestException as e:
             logger.error(f"Error sending notification: {e}")
             return False
 
-    def _extract_date(self, date_str: Optional[str]) -> Optional[str]:
-        """Extract just the date part (YYYY-MM-DD) from a date string"""
-        if not date_str:
-            return None
-
-        # Handle ISO format dates that might include time
-        try:
-            # Try to parse as datetime and extract just the date part
-            if 'T' in date_str:
-                # Handle ISO format with timezone
-                if 'Z' in date_str:
-                    date_obj = datetime.datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                else:
-                    date_obj = datetime.datetime.fromisoformat(date_str)
-
-                # Convert to EST timezone
-                est_date_obj = date_obj.astimezone(Config.TIMEZONE)
-                return est_date_obj.strftime('%Y-%m-%d')
-            else:
-                # It's already just a date
-                datetime.datetime.strptime(date_str, '%Y-%m-%d')  # Validate format
-                return date_str
-        except (ValueError, AttributeError):
-            return None
-
-    def _extract_time(self, date_str: Optional[str]) -> Optional[str]:
-        """Extract just the time part from a date string and format it nicely in EST"""
-        if not date_str or 'T' not in date_str:
-            return None
-
-        try:
-            # Parse the ISO format datetime
-            if 'Z' in date_str:
-                date_obj = datetime.datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            else:
-                date_obj = datetime.datetime.fromisoformat(date_str)
-
-            # Convert to EST timezone
-            est_date_obj = date_obj.astimezone(Config.TIMEZONE)
-
-            # Format as a nice time (e.g., "3:30 PM EST")
-            return est_date_obj.strftime('%I:%M %p EST')
-        except (ValueError, AttributeError):
-            return None
-
-
 def main():
+    # Side effects deferred from import time: install the log handler,
+    # read .env, and re-resolve the env-derived configuration
+    setup_logging()
+    load_dotenv(dotenv_path=Path('.') / '.env')
+    Config.load()
+
     # logging.getLogger().setLevel(logging.DEBUG)
     logger.info("Starting media release notifier...")
 
@@ -488,26 +755,52 @@ def main():
         logger.error("Discord webhook URL is not configured!")
         return
 
+    # One shared time snapshot for the whole run
+    ctx = RunContext.create()
+
     # Initialize Discord notifier
-    discord = DiscordNotifier(Config.DISCORD_WEBHOOK_URL)
+    discord = DiscordNotifier(Config.DISCORD_WEBHOOK_URL, ctx)
 
-    # Get movie releases from Radarr instances
-    movie_releases = {}
+    # Build one fetch task per configured instance. Each task gets its own
+    # API object, so nothing is shared between threads.
+    tasks = []
     for instance in Config.RADARR_INSTANCES:
         if instance["url"] and instance["api_key"]:
-            radarr = RadarrAPI(instance["url"], instance["api_key"], instance["name"])
-            releases = radarr.get_todays_releases()
-            movie_releases[instance["name"]] = releases
-            logger.info(f"Found {len(releases)} movie releases for {instance['name']}")
-
-    # Get TV episodes from Sonarr instances
-    tv_releases = {}
+            tasks.append((
+                "movie",
+                instance["name"],
+                lambda i=instance: RadarrAPI(i["url"], i["api_key"], i["name"], ctx).get_todays_releases()
+            ))
     for instance in Config.SONARR_INSTANCES:
         if instance["url"] and instance["api_key"]:
-            sonarr = SonarrAPI(instance["url"], instance["api_key"], instance["name"])
-            episodes = sonarr.get_todays_episodes()
-            tv_releases[instance["name"]] = episodes
-            logger.info(f"Found {len(episodes)} episode releases for {instance['name']}")
+            tasks.append((
+                "tv",
+                instance["name"],
+                lambda i=instance: SonarrAPI(i["url"], i["api_key"], i["name"], ctx).get_todays_episodes()
+            ))
+
+    # Run all instance fetches concurrently - they are independent network
+    # I/O, so wall time is roughly the slowest instance instead of the sum.
+    movie_releases = {}
+    tv_releases = {}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {executor.submit(fn): (kind, name) for kind, name, fn in tasks}
+        for future in as_completed(futures):
+            kind, name = futures[future]
+            results = future.result()
+            if kind == "movie":
+                movie_releases[name] = results
+                logger.info(f"Found {len(results)} movie releases for {name}")
+            else:
+                tv_releases[name] = results
+                logger.info(f"Found {len(results)} episode releases for {name}")
+
+    # On quiet days, skip the Discord round-trip entirely unless the
+    # "nothing today" message is wanted
+    any_releases = any(movie_releases.values()) or any(tv_releases.values())
+    if not any_releases and not Config.NOTIFY_ON_EMPTY:
+        logger.info("No releases today; skipping Discord post.")
+        return
 
     # Send notification
     success = discord.send_notification(movie_releases, tv_releases)